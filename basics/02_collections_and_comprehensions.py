@@ -2,8 +2,17 @@
 Python Collections: Lists, Dicts, and Comprehensions
 ---------------------------------------------------
 Coming from JavaScript, you'll find Python's data structures familiar but more powerful.
+
+Note on slicing: fruits[::-1] or fruits[::2] builds a brand new list. That's fine
+when you need a list (e.g. to print it), but if you only loop over the result once,
+reversed(fruits) or itertools.islice(fruits, 0, None, 2) stream the items without
+copying anything.
 """
 
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import islice
+
 # Lists (Python's arrays) - more powerful than JS arrays
 fruits = ["apple", "banana", "cherry", "date"]
 print("Original fruits:", fruits)
@@ -20,7 +29,16 @@ print("\nList slicing:")
 print("First 3 fruits:", fruits[:3])
 print("Last 2 fruits:", fruits[-2:])
 print("Every other fruit:", fruits[::2])
-print("Reverse order:", fruits[::-1])
+print("Reverse order:", fruits[::-1])  # print needs a real list, so slicing is fine here
+
+# When you only iterate, reversed()/islice() avoid allocating a copy
+# (note: ", ".join(reversed(fruits)) would still build a list internally)
+print("Reverse order (streamed):")
+for fruit in reversed(fruits):
+    print(" ", fruit)
+print("Every other fruit (streamed):")
+for fruit in islice(fruits, 0, None, 2):
+    print(" ", fruit)
 
 # List comprehensions (very Pythonic - like JS map/filter combined)
 print("\nList comprehensions:")
@@ -63,30 +81,37 @@ print("Unique languages:", languages)
 print("Is Python in set:", "Python" in languages)
 
 # Practical example: processing API-like data
+# A slotted, frozen dataclass stores each record as a fixed struct instead of a full dict,
+# so it uses much less memory and reads fields by attribute (task.status)
+@dataclass(slots=True, frozen=True)
+class Task:
+    id: int
+    name: str
+    status: str
+    priority: str
+
 api_response = [
-    {"id": 1, "name": "Task 1", "status": "completed", "priority": "high"},
-    {"id": 2, "name": "Task 2", "status": "pending", "priority": "low"},
-    {"id": 3, "name": "Task 3", "status": "completed", "priority": "medium"},
-    {"id": 4, "name": "Task 4", "status": "in_progress", "priority": "high"},
+    Task(1, "Task 1", "completed", "high"),
+    Task(2, "Task 2", "pending", "low"),
+    Task(3, "Task 3", "completed", "medium"),
+    Task(4, "Task 4", "in_progress", "high"),
 ]
 
 print(f"\nProcessing API response ({len(api_response)} tasks):")
 
 # Filter completed tasks (like JS filter)
-completed_tasks = [task for task in api_response if task["status"] == "completed"]
+completed_tasks = [task for task in api_response if task.status == "completed"]
 print(f"Completed tasks: {len(completed_tasks)}")
 
 # Get high priority task names (like JS filter + map)
-high_priority_names = [task["name"] for task in api_response if task["priority"] == "high"]
+high_priority_names = [task.name for task in api_response if task.priority == "high"]
 print(f"High priority tasks: {high_priority_names}")
 
 # Group by status (useful for APIs)
-status_groups = {}
+# defaultdict(list) creates the empty list on first access - no membership check needed
+status_groups = defaultdict(list)
 for task in api_response:
-    status = task["status"]
-    if status not in status_groups:
-        status_groups[status] = []
-    status_groups[status].append(task["name"])
+    status_groups[task.status].append(task.name)
 
 print("Tasks grouped by status:")
 for status, tasks in status_groups.items():
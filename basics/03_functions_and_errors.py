@@ -18,7 +18,10 @@ print(f"Tax on $100 at 10%: ${calculate_tax(100, 0.10):.2f}")
 def get_user_stats(users: list) -> tuple:
     """Return user statistics as a tuple."""
     total = len(users)
-    active = sum(1 for user in users if user.get("is_active", False))
+    active = 0
+    for user in users:  # plain loop avoids resuming a generator for every user
+        if user.get("is_active", False):
+            active += 1
     return total, active
 
 users_data = [
@@ -30,12 +33,17 @@ users_data = [
 total_users, active_users = get_user_stats(users_data)  # tuple unpacking
 print(f"\nUser stats: {total_users} total, {active_users} active")
 
-# Lambda functions (similar to JS arrow functions)
+# Lambda functions (similar to JS arrow functions) - handy as a sort key
+users_by_name = sorted(users_data, key=lambda u: u["name"])
+
+# For map/filter style work, comprehensions do the same job without
+# calling a lambda for every element
 numbers = [1, 2, 3, 4, 5]
-squared = list(map(lambda x: x ** 2, numbers))
-even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
+squared = [x * x for x in numbers]
+even_numbers = [x for x in numbers if x % 2 == 0]
 
-print(f"\nLambda examples:")
+print(f"\nLambda and comprehension examples:")
+print(f"Users sorted by name: {[u['name'] for u in users_by_name]}")
 print(f"Original: {numbers}")
 print(f"Squared: {squared}")
 print(f"Even numbers: {even_numbers}")
@@ -11,6 +11,8 @@ from typing import Optional
 class User:
     """A simple User class demonstrating Python OOP concepts."""
     
+    __slots__ = ("name", "email", "role", "is_active", "_login_count")  # fixed attributes, no per-instance __dict__
+    
     # Class variable (shared by all instances)
     total_users = 0
     
@@ -56,7 +58,9 @@ class User:
     @staticmethod
     def is_valid_email(email: str) -> bool:
         """Static method for email validation."""
-        return "@" in email and "." in email.split("@")[1]
+        # rpartition splits on the last "@" in one pass, without building a list
+        _, sep, tail = email.rpartition("@")
+        return sep == "@" and "." in tail
 
 # Create user instances
 print("Creating users:")
@@ -91,6 +95,8 @@ print(f"Invalid email 'invalid-email': {User.is_valid_email('invalid-email')}")
 class Developer(User):
     """Developer class inheriting from User."""
     
+    __slots__ = ("languages", "projects")  # only the new attributes; the rest come from User
+    
     def __init__(self, name: str, email: str, languages: Optional[list] = None):
         super().__init__(name, email, "developer")  # Call parent constructor
         self.languages = languages or []
@@ -134,6 +140,8 @@ print(f"Developer info: {dev.get_info()}")
 class Product:
     """Product class demonstrating properties."""
     
+    __slots__ = ("name", "_price")
+    
     def __init__(self, name: str, price: float):
         self.name = name
         self._price = price  # "private" attribute
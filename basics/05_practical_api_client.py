@@ -5,31 +5,52 @@ A practical example combining all Python concepts we've learned.
 This simulates working with APIs - common in backend development.
 """
 
-import json
-from typing import Dict, List, Optional, Union
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
+try:
+    import orjson  # optional: much faster JSON serializer written in Rust
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# Logging formats messages lazily: nothing is built unless the level is enabled
+log = logging.getLogger(__name__)
+
 class APIClient:
     """A simple API client demonstrating Python best practices."""
     
+    __slots__ = ("base_url", "api_key", "session_data", "_request_count", "_routes")  # fixed attributes, no per-instance __dict__
+    
     def __init__(self, base_url: str, api_key: Optional[str] = None):
         self.base_url = base_url.rstrip('/')  # Remove trailing slash
         self.api_key = api_key
         self.session_data = {}
         self._request_count = 0
+        # Route table keyed by the first path segment - one dict lookup per request
+        self._routes = {
+            "users": self._handle_users_endpoint,
+            "auth": self._handle_auth_endpoint,
+        }
     
     def _make_request(self, endpoint: str, method: str = "GET", data: Optional[Dict] = None) -> Dict:
         """Simulate making an HTTP request."""
         self._request_count += 1
         
         # Simulate request processing
-        print(f"[{method}] {self.base_url}{endpoint}")
+        log.debug("[%s] %s%s", method, self.base_url, endpoint)
         
         # Simulate different responses based on endpoint
-        if endpoint.startswith("/users"):
-            return self._handle_users_endpoint(endpoint, method, data)
-        elif endpoint.startswith("/auth"):
-            return self._handle_auth_endpoint(endpoint, method, data)
+        handler = self._routes.get(endpoint[1:].partition("/")[0])
+        if handler:
+            return handler(endpoint, method, data)
         else:
             return {"error": "Endpoint not found", "status": 404}
     
@@ -54,6 +75,14 @@ class APIClient:
                 "created_at": datetime.now().isoformat()
             }
             return {"status": 201, "data": new_user}
+        elif method == "POST" and endpoint == "/users/batch" and data:
+            # One timestamp for the whole batch instead of a clock call per user
+            now = datetime.now().isoformat()
+            new_users = [
+                {"id": 999 + i, "name": row.get("name"), "email": row.get("email"), "active": True, "created_at": now}
+                for i, row in enumerate(data.get("users", []))
+            ]
+            return {"status": 201, "data": new_users}
         else:
             return {"error": "Invalid users endpoint", "status": 400}
     
@@ -85,7 +114,7 @@ class APIClient:
             else:
                 raise APIError(f"Failed to get users: {response.get('error')}")
         except Exception as e:
-            print(f"Error getting users: {e}")
+            log.error("Error getting users: %s", e)
             return []
     
     def create_user(self, name: str, email: str) -> Optional[Dict]:
@@ -101,22 +130,38 @@ class APIClient:
         else:
             raise APIError(f"Failed to create user: {response.get('error')}")
     
+    def create_users(self, rows: List[Tuple[str, str]]) -> List[Dict]:
+        """Create several users from (name, email) pairs in a single request."""
+        for _, email in rows:
+            if not self._is_valid_email(email):
+                raise ValueError(f"Invalid email format: {email}")
+        
+        batch_data = {"users": [{"name": name, "email": email} for name, email in rows]}
+        response = self._make_request("/users/batch", "POST", batch_data)
+        
+        if response.get("status") == 201:
+            return response.get("data", [])
+        else:
+            raise APIError(f"Failed to create users: {response.get('error')}")
+    
     def login(self, username: str, password: str) -> bool:
         """Authenticate with the API."""
         auth_data = {"username": username, "password": password}
         response = self._make_request("/auth/login", "POST", auth_data)
         
         if response.get("status") == 200:
-            print(f"Login successful! Token: {self.session_data.get('token')}")
+            log.info("Login successful!")
             return True
         else:
-            print(f"Login failed: {response.get('error')}")
+            log.warning("Login failed: %s", response.get("error"))
             return False
 
     @staticmethod  # Marks the method as a static method, meaning it does not access or modify class or instance state.
     def _is_valid_email(email: str) -> bool:
         """Validate email format."""
-        return "@" in email and "." in email.split("@")[1]
+        # rpartition splits on the last "@" in one pass, without building a list
+        _, sep, tail = email.rpartition("@")
+        return sep == "@" and "." in tail
     
     def get_stats(self) -> Dict:
         """Get client statistics."""
@@ -134,40 +179,54 @@ class APIError(Exception):
 class UserManager:
     """Higher-level user management using the API client."""
     
+    __slots__ = ("api", "users_cache", "last_fetch", "_by_email", "_active")
+    
     def __init__(self, api_client: APIClient):
         self.api = api_client
         self.users_cache = []
         self.last_fetch = None
+        self._by_email = {}  # email -> user, for O(1) lookups
+        self._active = []  # active users, rebuilt on refresh
     
     def refresh_users(self) -> None:
         """Refresh the users cache."""
         self.users_cache = self.api.get_users()
+        self._by_email = {}
+        for user in self.users_cache:
+            email = user.get("email")
+            if email:
+                self._by_email.setdefault(email, user)  # keep the first user with this email
+        self._active = [user for user in self.users_cache if user.get("active", False)]
         self.last_fetch = datetime.now()
         print(f"Refreshed {len(self.users_cache)} users from API")
     
     def get_active_users(self) -> List[Dict]:
-        """Get only active users."""
+        """Get only active users (use count_active() if you only need how many)."""
         if not self.users_cache:
             self.refresh_users()
         
-        return [user for user in self.users_cache if user.get("active", False)]
+        return list(self._active)  # copy so callers can't mutate the cached list
+    
+    def count_active(self) -> int:
+        """Count active users without building a new list."""
+        if not self.users_cache:
+            self.refresh_users()
+        
+        return len(self._active)
     
     def find_user_by_email(self, email: str) -> Optional[Dict]:
         """Find a user by email address."""
         if not self.users_cache:
             self.refresh_users()
         
-        for user in self.users_cache:
-            if user.get("email") == email:
-                return user
-        return None
+        return self._by_email.get(email)
     
     def create_and_add_user(self, name: str, email: str) -> Optional[Dict]:
         """Create a user and add to cache."""
         try:
             new_user = self.api.create_user(name, email)
             if new_user:
-                self.users_cache.append(new_user)
+                self._cache_user(new_user)
                 print(f"Created and cached user: {new_user['name']}")
                 return new_user
             return None
@@ -175,33 +234,49 @@ class UserManager:
             print(f"Failed to create user: {e}")
             raise
     
+    def create_and_add_users(self, rows: List[Tuple[str, str]]) -> List[Dict]:
+        """Create several users in one request and add them all to the cache."""
+        try:
+            new_users = self.api.create_users(rows)
+            for new_user in new_users:
+                self._cache_user(new_user)
+            print(f"Created and cached {len(new_users)} users")
+            return new_users
+        except (APIError, ValueError) as e:
+            print(f"Failed to create users: {e}")
+            raise
+    
+    def _cache_user(self, user: Dict) -> None:
+        """Add a newly created user to the cache and its lookup indexes."""
+        self.users_cache.append(user)
+        self._by_email.setdefault(user["email"], user)
+        if user.get("active", False):
+            self._active.append(user)
+    
     def get_user_summary(self) -> Dict:
         """Get summary statistics about users."""
         if not self.users_cache:
             self.refresh_users()
         
         total = len(self.users_cache)
-        active = len(self.get_active_users())
+        active = self.count_active()
         
-        # Get email domains
-        domains = {}
-        for user in self.users_cache:
-            email = user.get("email", "")
-            if "@" in email:
-                domain = email.split("@")[1]
-                domains[domain] = domains.get(domain, 0) + 1
+        # Count email domains - building a Counter from an iterable does the counting in C
+        emails = (user.get("email", "") for user in self.users_cache)
+        domains = Counter(email[email.rfind("@") + 1:] for email in emails if "@" in email)
         
         return {
             "total_users": total,
             "active_users": active,
             "inactive_users": total - active,
-            "email_domains": domains,
+            "email_domains": dict(domains),
             "last_refresh": self.last_fetch.isoformat() if self.last_fetch else None
         }
 
 # Main execution - demonstrate the API client
 def main():
     """Main function demonstrating the API client usage."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")  # use DEBUG to trace every request
     print("=== Python API Client Demo ===\n")
     
     # Initialize API client
@@ -236,15 +311,23 @@ def main():
     except Exception as e:
         print(f"Error creating user: {e}\n")
     
+    # Create several users in one request
+    print("5. Creating users in a batch:")
+    try:
+        batch = user_manager.create_and_add_users([("Eve", "eve@example.com"), ("Frank", "frank@example.com")])
+        print(f"Batch created: {[user['name'] for user in batch]}\n")
+    except Exception as e:
+        print(f"Error creating users: {e}\n")
+    
     # Get summary
-    print("5. User summary:")
+    print("6. User summary:")
     summary = user_manager.get_user_summary()
-    print(json.dumps(summary, indent=2))
+    print(_dumps(summary))
     
     # Show client stats
-    print(f"\n6. Client statistics:")
+    print(f"\n7. Client statistics:")
     stats = client.get_stats()
-    print(json.dumps(stats, indent=2))
+    print(_dumps(stats))
 
 if __name__ == "__main__":
     main()
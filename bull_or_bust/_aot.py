@@ -0,0 +1,23 @@
+"""
+Ahead-of-time build of the screener's numeric kernel.
+
+Run once with `python bull_or_bust/_aot.py` to produce _screener_numeric.*.so
+next to screener.py. The screener imports it instead of JIT-compiling at startup.
+
+Note: numba.pycc is pending deprecation in Numba. If it goes away, screener.py
+falls back to the cached @njit version of the same kernel.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from _numeric import daily_change
+
+cc = CC('_screener_numeric')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))  # build next to screener.py
+cc.export('daily_change', 'UniTuple(f8, 3)(f8[:])')(daily_change)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,13 @@
+"""
+Numeric kernels shared by the screener's JIT path and the AOT build in _aot.py.
+
+Plain Python functions: screener.py wraps them with @njit, _aot.py exports them
+with numba.pycc, so there is only one copy of the math to keep in sync.
+"""
+
+
+def daily_change(close):
+    """Return (latest, previous, percent change) from an array of closing prices."""
+    last = close[-1]
+    prev = close[-2]
+    return last, prev, (last - prev) / prev * 100.0
@@ -1,33 +1,142 @@
+import functools
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
 import yfinance as yf
 
-ticker = 'AAPL'
-print(f"Getting stock data for {ticker}...")
+CACHE_DIR = Path("~/.cache/bob").expanduser()
+CACHE_MAX_AGE = 3600  # seconds before a cached download is considered stale
+
+
+try:
+    # Prebuilt by _aot.py - imports like any compiled extension, no JIT on startup
+    from _screener_numeric import daily_change as _daily_change
+except ImportError:
+    from numba import njit
+
+    from _numeric import daily_change as _daily_change_py
+
+    _daily_change = njit(cache=True)(_daily_change_py)  # compiled to native code once, cached on disk for later runs
+
+    # Warm up the JIT on a dummy array so compilation doesn't happen on the user-visible path
+    _daily_change(np.array([1.0, 1.0], dtype=np.float64))
+
+
+def _cached_download(tickers, period: str, cache_name: str) -> pd.DataFrame:
+    """Download price history, reusing a recent copy saved on disk if there is one."""
+    cache_path = CACHE_DIR / f"{cache_name}_{period}.parquet"
+    if cache_path.exists() and (time.time() - cache_path.stat().st_mtime) < CACHE_MAX_AGE:
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            # Missing parquet engine, unreadable or corrupt file - treat it as a cache miss
+            cache_path.unlink(missing_ok=True)
+
+    # yfinance fetches multiple tickers on parallel threads
+    data = yf.download(tickers, period=period, auto_adjust=True, threads=True, progress=False)
+    if data is not None and not data.empty:
+        # The disk cache is best-effort: it needs pyarrow/fastparquet and a writable ~/.cache
+        tmp_path = None
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and swap it in, so an interrupted write never leaves a broken cache
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".parquet.tmp")
+            os.close(fd)
+            data.to_parquet(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    return data
+
+
+@functools.lru_cache(maxsize=64)  # repeat calls in the same run skip the disk too
+def fetch(ticker: str, period: str = "1y") -> pd.DataFrame:
+    """Price history for one ticker."""
+    return _cached_download(ticker, period, ticker)
+
+
+@functools.lru_cache(maxsize=64)
+def fetch_many(tickers: tuple[str, ...], period: str = "1y") -> pd.DataFrame:
+    """Price history for several tickers in one batched download (tuple so it can be cached)."""
+    return _cached_download(list(tickers), period, "-".join(tickers))
+
+
+def screen(tickers: list[str], top: int = 10) -> None:
+    """Download several tickers in one call and print the biggest daily movers."""
+    data = fetch_many(tuple(tickers))
+    if data is None or data.empty:
+        print("Error: Could not retrieve data for the watchlist")
+        return
+
+    # Closing prices as a (days, tickers) matrix, columns in the order we asked for
+    close = data['Close'][tickers].to_numpy(dtype=np.float64)
+    if close.shape[0] < 2:
+        print(f"Error: Need at least two days of data to screen, got {close.shape[0]}")
+        return
+    pct = (close[-1] - close[-2]) / close[-2] * 100.0  # every ticker's change in one NumPy operation
+
+    print(f"\nTop movers out of {len(tickers)} tickers:")
+    valid = np.flatnonzero(~np.isnan(pct))  # drop tickers with missing prices
+    for i in valid[np.argsort(pct[valid])[::-1][:top]]:  # largest change first
+        print(f"  {tickers[i]:<6} ${close[-1, i]:>9.2f} ({pct[i]:+.2f}%)")
+
+
+def main(ticker: str = 'AAPL') -> int:
+    """Print recent prices and the daily change for one ticker. Returns an exit status."""
+    print(f"Getting stock data for {ticker}...")
+
+    stock_data = fetch(ticker)
+
+    if stock_data is None or stock_data.empty:
+        print(f"Error: Could not retrieve data for {ticker}")
+        return 1
+
+    # Grab the closing prices once as a plain NumPy array instead of indexing through pandas each time
+    # .ravel() flattens the (N, 1) array yfinance gives for a single ticker into a 1-D array
+    closes = stock_data['Close'].to_numpy(dtype=np.float64, copy=False).ravel()
+
+    # The compiled kernel doesn't bounds-check, so make sure there are two days to compare
+    if len(closes) < 2:
+        print(f"Error: Need at least two days of data for {ticker}, got {len(closes)}")
+        return 1
+
+    # Show the last 5 days of data
+    print(f"\nLast 5 days of data for {ticker}:")
+    recent_data = stock_data.tail(5)
+    print(recent_data)
+
+    latest_price, yesterday_price, change_percent = _daily_change(closes)
+
+    print(f"\nLatest closing price: ${latest_price:.2f}") # :.2f formats the float to 2 decimal places
 
-stock_data = yf.download(ticker, period="1y", auto_adjust=True, progress=False)
+    # Calculate daily change
+    daily_change = latest_price - yesterday_price
 
-if stock_data is None or stock_data.empty:
-    print(f"Error: Could not retrieve data for {ticker}")
-    exit(1)
+    print(f"Daily change: ${daily_change:.2f} ({change_percent:+.2f}%)")
 
-# Show the last 5 days of data
-print(f"\nLast 5 days of data for {ticker}:")
-recent_data = stock_data.tail(5)
-print(recent_data)
+    if daily_change > 0:
+        print("Stock went up today")
+    elif daily_change < 0:
+        print("Stock went down today")
+    else:
+        print("Stock stayed the same today")
 
-latest_price = stock_data['Close'].iloc[-1].item() # .iloc[-1] is used for getting the last element
-yesterday_price = stock_data['Close'].iloc[-2].item() # .iloc[-2] is used for getting the second to last element
+    return 0
 
-print(f"\nLatest closing price: ${latest_price:.2f}") # :.2f formats the float to 2 decimal places
 
-# Calculate daily change
-daily_change = latest_price - yesterday_price
-change_percent = (daily_change / yesterday_price) * 100
+if __name__ == "__main__":
+    status = main()
 
-print(f"Daily change: ${daily_change:.2f} ({change_percent:+.2f}%)") 
+    # Screen a whole watchlist at once instead of looping over tickers one by one
+    # Opt-in with `python screener.py --screen`, since it's an extra download
+    if "--screen" in sys.argv[1:]:
+        watchlist = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA']
+        screen(watchlist)
 
-if daily_change > 0:
-    print("Stock went up today")
-elif daily_change < 0:
-    print("Stock went down today")
-else:
-    print("Stock stayed the same today")
\ No newline at end of file
+    sys.exit(status)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Optional Cython build for the API client exercise.
+
+The source stays a plain .py file (Cython "pure Python mode"), so the script
+still runs with the regular interpreter. To build the compiled extension:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+This produces practical_api_client.*.so, importable as `practical_api_client`.
+The extension needs a valid module name, since "05_practical_api_client" starts
+with a digit and can't be imported directly. `python basics/05_practical_api_client.py`
+always runs the interpreted source; to run the compiled demo instead:
+
+    python -c "import practical_api_client as m; m.main()"
+"""
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+extensions = [
+    Extension("practical_api_client", ["basics/05_practical_api_client.py"]),
+]
+
+setup(
+    name="relearning-python",
+    ext_modules=cythonize(
+        extensions,
+        compiler_directives={
+            "language_level": 3,
+            "infer_types": True,
+        },
+    ),
+)